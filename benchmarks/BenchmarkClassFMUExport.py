@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from fmipp.export.FMIAdapterV2 import FMIAdapterV2
+
+class FMUBenchmarkClass( FMIAdapterV2 ):
+    """
+    Same variables and computations as class FMUExportTestClass (see demos/TestClassFMUExport.py),
+    but without any console output, so that benchmarks measure only the overhead of the export interface.
+    """
+
+    def init( self, currentCommunicationPoint ):
+        """
+        Initialize the FMU (definition of input/output variables and parameters).
+        """
+        self.defineRealParameters( 'pr_x', 'pr_y' )
+        self.defineRealInputs( 'ir_x', 'ir_y' )
+        self.defineRealOutputs( 'or_x', 'or_y' )
+
+        self.defineIntegerParameters( 'pi_x', 'pi_y' )
+        self.defineIntegerInputs( 'ii_x', 'ii_y' )
+        self.defineIntegerOutputs( 'oi_x', 'oi_y' )
+
+        self.defineBooleanParameters( 'pb_x', 'pb_y' )
+        self.defineBooleanInputs( 'ib_x', 'ib_y' )
+        self.defineBooleanOutputs( 'ob_x', 'ob_y' )
+
+        self.defineStringParameters( 'ps_x', 'ps_y' )
+        self.defineStringInputs( 'is_x', 'is_y' )
+        self.defineStringOutputs( 'os_x', 'os_y' )
+
+
+    def doStep( self, currentCommunicationPoint, communicationStepSize ):
+        """
+        Make a simulation step.
+        """
+
+        # real
+
+        realParam = self.getRealParameterValues()
+        realInputs = self.getRealInputValues()
+
+        realOutputs = {
+            'or_x' : realInputs['ir_x']*realParam['pr_x'],
+            'or_y' : realInputs['ir_y']*realParam['pr_y']
+            }
+        self.setRealOutputValues( realOutputs )
+
+        # integer
+
+        integerParam = self.getIntegerParameterValues()
+        integerInputs = self.getIntegerInputValues()
+
+        integerOutputs = {
+            'oi_x' : integerInputs['ii_x']*integerParam['pi_x'],
+            'oi_y' : integerInputs['ii_y']*integerParam['pi_y']
+            }
+        self.setIntegerOutputValues( integerOutputs )
+
+        # boolean
+
+        booleanParam = self.getBooleanParameterValues()
+        booleanInputs = self.getBooleanInputValues()
+
+        booleanOutputs = {
+            'ob_x' : booleanInputs['ib_x'] or booleanParam['pb_x'],
+            'ob_y' : booleanInputs['ib_y'] and booleanParam['pb_y']
+            }
+        self.setBooleanOutputValues( booleanOutputs )
+
+        # string
+
+        stringParam = self.getStringParameterValues()
+        stringInputs = self.getStringInputValues()
+
+        stringOutputs = {
+            'os_x' : stringInputs['is_x'] + stringParam['ps_x'],
+            'os_y' : stringInputs['is_y'] + stringParam['ps_y']
+            }
+        self.setStringOutputValues( stringOutputs )
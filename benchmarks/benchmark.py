@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Benchmarks for the FMI++ Python interface
+# 
+# This script measures the performance of the import, incremental and export paths of the FMI++ Python interface, using the FMUs of this tutorial:
+# 
+#  * latency of loading, instantiating and initializing FMU zigzag with class **FMUModelExchangeV2**, for the first (cold) load in a fresh process and for further (warm) loads in the same process,
+#  * integration steps per second of FMU zigzag, for integrator types *bdf* and *rk*,
+#  * synchronization throughput of class **IncrementalFMU** for a seeded stream of random input events,
+#  * overhead per call of *doStep* for an FMU for Co-Simulation exported from class **FMUBenchmarkClass** (see file *BenchmarkClassFMUExport.py*).
+# 
+# All timings (*min*, *mean*, *max*) are wall times in seconds for one complete repetition of a benchmark. The results are written in JSON format to a file, so that they can be compared between versions.
+# 
+# Usage: *python benchmark.py [--repeat N] [--output benchmark_results.json]*
+
+import fmipp
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+
+# Specify the path to the tutorial's FMU zigzag.
+
+root_dir = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+demos_dir = os.path.join( root_dir, 'demos' )
+data_dir = os.path.join( demos_dir, 'data', 'win' if sys.platform.startswith( 'win' ) else 'linux' )
+
+model_name = 'zigzag'
+
+
+# Specify the FMU's configuration parameters (same as in the demos).
+
+logging_on = False
+stop_before_event = False
+event_search_precision = 1e-2
+
+
+# ## Helper functions
+
+def summarize( samples ):
+    """
+    Return minimum, mean and maximum of a list of timing samples (wall time in seconds per repetition).
+    """
+    return {
+        'min' : min( samples ),
+        'mean' : sum( samples ) / len( samples ),
+        'max' : max( samples )
+        }
+
+
+def load_zigzag( uri_to_extracted_fmu, integrator_type, instance_name ):
+    """
+    Load, instantiate and initialize FMU zigzag (with slope k = 1).
+    """
+    fmu = fmipp.FMUModelExchangeV2(
+       uri_to_extracted_fmu, model_name,
+       logging_on, stop_before_event, event_search_precision, integrator_type
+       )
+
+    status = fmu.instantiate( instance_name )
+    assert status == fmipp.fmiOK
+
+    status = fmu.setRealValue( 'k', 1.0 )
+    assert status == fmipp.fmiOK
+
+    status = fmu.initialize()
+    assert status == fmipp.fmiOK
+
+    return fmu
+
+
+# ## Benchmarks
+
+def time_initialize( uri_to_extracted_fmu, instance_name ):
+    """
+    Return the time needed to load, instantiate and initialize FMU zigzag.
+    """
+    start = timeit.default_timer()
+    load_zigzag( uri_to_extracted_fmu, fmipp.bdf, instance_name )
+    return timeit.default_timer() - start
+
+
+def bench_initialize( uri_to_extracted_fmu, repeat ):
+    """
+    Measure the time needed to load, instantiate and initialize FMU zigzag. Cold loads are
+    timed in a fresh Python process for every repetition (see option --cold-initialize),
+    warm loads are timed in this process after the FMU has been loaded once.
+    """
+    cold_samples = []
+    for i in range( repeat ):
+        output = subprocess.check_output(
+           [ sys.executable, os.path.abspath( __file__ ), '--cold-initialize', uri_to_extracted_fmu ] )
+        cold_samples.append( float( output.decode().split()[-1] ) )
+
+    load_zigzag( uri_to_extracted_fmu, fmipp.bdf, 'zigzag_warmup' )
+
+    warm_samples = []
+    for i in range( repeat ):
+        warm_samples.append( time_initialize( uri_to_extracted_fmu, 'zigzag_init_{}'.format( i ) ) )
+
+    return {
+        'cold' : summarize( cold_samples ),
+        'warm' : summarize( warm_samples )
+        }
+
+
+def bench_integrate( uri_to_extracted_fmu, integrator_type, repeat, tstop = 600., stepsize = 0.125 ):
+    """
+    Measure the number of integration steps (calls to integrate) per second for FMU zigzag.
+    """
+    samples = []
+    n_steps = 0
+    for i in range( repeat ):
+        fmu = load_zigzag( uri_to_extracted_fmu, integrator_type, 'zigzag_integrate_{}'.format( i ) )
+
+        t = 0.
+        n_steps = 0
+        start = timeit.default_timer()
+        while ( t < tstop ):
+            t = fmu.integrate( t + stepsize )
+            fmu.getRealValue( 'x' )
+            n_steps += 1
+        samples.append( timeit.default_timer() - start )
+
+    result = summarize( samples )
+    result['steps'] = n_steps
+    result['steps_per_second'] = n_steps / result['mean']
+    return result
+
+
+def bench_incremental( uri_to_extracted_fmu, repeat, sim_stop = 100., seed = 123 ):
+    """
+    Measure the number of calls to sync per second for class IncrementalFMU, with the same
+    seeded stream of random input events as in demo TestIncrementalFMU.
+    """
+    horizon = 0.3
+    prediction_step_size = horizon / 5.
+    integrator_step_size = prediction_step_size / 10.
+    sim_step = horizon
+
+    init_vars = fmipp.new_string_array( 1 )
+    fmipp.string_array_setitem( init_vars, 0, 'k' )
+    init_vals = fmipp.new_double_array( 1 )
+
+    output_names = fmipp.new_string_array( 2 )
+    fmipp.string_array_setitem( output_names, 0, 'x' )
+    fmipp.string_array_setitem( output_names, 1, 'derx' )
+
+    input_names = fmipp.new_string_array( 1 )
+    fmipp.string_array_setitem( input_names, 0, 'k' )
+
+    real_input_vals = fmipp.new_double_array( 1 )
+
+    samples = []
+    n_syncs = 0
+    n_events = 0
+    for i in range( repeat ):
+        k = 1.0
+        fmipp.double_array_setitem( init_vals, 0, k )
+
+        fmu = fmipp.IncrementalFMU( uri_to_extracted_fmu, model_name, logging_on, event_search_precision, fmipp.bdf )
+        fmu.defineRealOutputs( output_names, 2 )
+        fmu.defineRealInputs( input_names, 1 )
+
+        status = fmu.init( 'zigzag_incremental_{}'.format( i ), init_vars, init_vals, 1, 0., horizon, prediction_step_size, integrator_step_size )
+        assert status == 1
+
+        rng = random.Random( seed )
+        time = 0.
+        next = 0.
+        n_syncs = 0
+        n_events = 0
+        start = timeit.default_timer()
+        while ( time + sim_step < sim_stop ):
+            oldnext = next
+            if ( rng.random() < 0.2 ):
+                event_time = time + min( sim_step, next - time ) * rng.random()
+                k = max( 1, k + rng.choice( [ 1, -2 ] ) )
+                fmipp.double_array_setitem( real_input_vals, 0, k )
+                next = fmu.sync( time, event_time, real_input_vals )
+                time = event_time
+                n_events += 1
+            else:
+                next = fmu.sync( time, min( time + sim_step, next ) )
+                time = min( time + sim_step, oldnext )
+            fmu.getRealOutputs()
+            n_syncs += 1
+        samples.append( timeit.default_timer() - start )
+
+    fmipp.delete_string_array( init_vars )
+    fmipp.delete_double_array( init_vals )
+    fmipp.delete_string_array( output_names )
+    fmipp.delete_string_array( input_names )
+    fmipp.delete_double_array( real_input_vals )
+
+    result = summarize( samples )
+    result['syncs'] = n_syncs
+    result['input_events'] = n_events
+    result['syncs_per_second'] = n_syncs / result['mean']
+    return result
+
+
+def bench_export( work_dir, repeat, n_steps = 1000 ):
+    """
+    Measure the overhead per call of doStep for an FMU for Co-Simulation exported from class
+    FMUBenchmarkClass, which has the same variables as class FMUExportTestClass (see demo
+    TestFMUExport) but writes no console output.
+    """
+    from fmipp.export.createFMU import createFMU
+
+    from BenchmarkClassFMUExport import FMUBenchmarkClass
+
+    export_model_name = 'FMUBenchmarkCS'
+    start_values = {
+       'pr_y' : 2.2, 'pr_x' : 1.1,
+       'ir_y' : 2., 'ir_x' : 1.,
+       'pi_y' : 3, 'pi_x' : 6,
+       'ii_y' : 4, 'ii_x' : 5,
+       'pb_y' : True, 'pb_x' : True,
+       'ib_y' : False, 'ib_x' : True,
+       'ps_y' : 'abc', 'ps_x' : 'def',
+       'is_y' : 'ghi', 'is_x' : 'jkl'
+    }
+
+    # Function createFMU creates the FMU in the current working directory.
+    cwd = os.getcwd()
+    os.chdir( work_dir )
+    try:
+        createFMU(
+           FMUBenchmarkClass, export_model_name, fmi_version = '2',
+           verbose = False, start_values = start_values )
+    finally:
+        os.chdir( cwd )
+
+    path_to_fmu = os.path.join( work_dir, export_model_name + '.fmu' )
+    uri_to_extracted_fmu = fmipp.extractFMU( path_to_fmu, work_dir )
+
+    samples = []
+    for i in range( repeat ):
+        fmu = fmipp.FMUCoSimulationV2(
+           uri_to_extracted_fmu, export_model_name,
+           logging_on, 1e-9
+           )
+
+        status = fmu.instantiate( 'export_{}'.format( i ), 0., False, False )
+        assert status == fmipp.fmiOK
+
+        status = fmu.initialize( 0., True, float( n_steps ) )
+        assert status == fmipp.fmiOK
+
+        time = 0.
+        step_size = 1.
+        start = timeit.default_timer()
+        for step in range( n_steps ):
+            status = fmu.doStep( time, step_size, True )
+            assert status == fmipp.fmiOK
+            time += step_size
+        samples.append( timeit.default_timer() - start )
+
+    result = summarize( samples )
+    result['steps'] = n_steps
+    result['seconds_per_step'] = result['mean'] / n_steps
+    return result
+
+
+# ## Running the benchmarks
+
+def main():
+    parser = argparse.ArgumentParser( description = 'Benchmarks for the FMI++ Python interface.' )
+    parser.add_argument( '--repeat', type = int, default = 5, help = 'number of repetitions per benchmark' )
+    parser.add_argument( '--output', default = 'benchmark_results.json', help = 'write JSON results to this file (default: benchmark_results.json)' )
+    parser.add_argument( '--cold-initialize', metavar = 'URI', default = None, help = argparse.SUPPRESS )
+    args = parser.parse_args()
+
+    # Time a single cold load of FMU zigzag (used by bench_initialize in a fresh process).
+    if args.cold_initialize is not None:
+        print( time_initialize( args.cold_initialize, 'zigzag_cold' ) )
+        return
+
+    work_dir = tempfile.mkdtemp( prefix = 'fmipp_benchmark_' )
+    try:
+        uri_to_extracted_fmu = fmipp.extractFMU( os.path.join( data_dir, model_name + '.fmu' ), work_dir )
+
+        results = {
+            'python' : platform.python_version(),
+            'platform' : platform.platform(),
+            'repeat' : args.repeat,
+            'benchmarks' : {
+                'initialize' : bench_initialize( uri_to_extracted_fmu, args.repeat ),
+                'integrate_bdf' : bench_integrate( uri_to_extracted_fmu, fmipp.bdf, args.repeat ),
+                'integrate_rk' : bench_integrate( uri_to_extracted_fmu, fmipp.rk, args.repeat ),
+                'incremental_sync' : bench_incremental( uri_to_extracted_fmu, args.repeat ),
+                'export_do_step' : bench_export( work_dir, args.repeat )
+                }
+            }
+    finally:
+        shutil.rmtree( work_dir, ignore_errors = True )
+
+    # The FMI++ library may write messages to the standard output, hence the results go to a file.
+    with open( args.output, 'w' ) as f:
+        json.dump( results, f, indent = 2, sort_keys = True )
+
+    print( 'benchmark results written to {}'.format( args.output ) )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Scheduling many IncrementalFMUs in an event-based simulation
+# 
+# Class **IncrementalFMU** returns the time of the next scheduled synchronization whenever its method *sync* is called (see demo *TestIncrementalFMU*). When many instances take part in the same event-based simulation, there is no need to poll every instance at every tick. Instead, all instances can be kept in a priority queue (heap), sorted by their next scheduled synchronization time. Only the instance at the top of the queue is advanced, and external input events are routed only to the instances they affect. The effort per event then grows with *O(log n)* for *n* instances, instead of *O(n)* per tick.
+# 
+# ## Loading the library and extracting an FMU
+# 
+# Load the FMI++ library into Python.
+
+import fmipp
+
+
+# Specify the FMU's model name.
+
+model_name = 'zigzag'
+
+
+# Specify the absolute path of the FMU. In this example, the FMU is supposed to be in the same directory as this notebook.
+
+import os
+work_dir = os.getcwd() # get current working directory (contains 'zigzag.fmu')
+path_to_fmu = os.path.join( work_dir, 'data', 'win', model_name + '.fmu' ) # path to FMU
+
+
+# Extract the FMU to the current work directory. The return value is the URI to the folder containing the unzipped FMU.
+
+uri_to_extracted_fmu = fmipp.extractFMU( path_to_fmu, work_dir )
+print( 'URI of extracted FMU: {}'.format( uri_to_extracted_fmu ) )
+
+
+# ## Loading, instantiating and initialising the FMUs
+# 
+# Specify the configuration parameters for class IncrementalFMU.
+
+logging_on = False              # turn logging on/off
+event_search_precision = 1e-2   # set precision for event detection
+integrator_type = fmipp.bdf     # use Backward Differentiation Formula from CVODE
+
+
+# Specify the lookahead horizon, the step size for storing predictions and the internal integrator step size (same for all instances).
+
+horizon = 0.3
+prediction_step_size = horizon / 5.
+integrator_step_size = prediction_step_size / 10.
+
+
+# Construct the string and double arrays for the parameter, input and output names, as in demo *TestIncrementalFMU*. The arrays are shared by all instances.
+
+init_vars = fmipp.new_string_array( 1 )
+fmipp.string_array_setitem( init_vars, 0, 'k' )
+init_vals = fmipp.new_double_array( 1 )
+
+output_names = fmipp.new_string_array( 2 )
+fmipp.string_array_setitem( output_names, 0, 'x' )
+fmipp.string_array_setitem( output_names, 1, 'derx' )
+
+input_names = fmipp.new_string_array( 1 )
+fmipp.string_array_setitem( input_names, 0, 'k' )
+
+real_input_vals = fmipp.new_double_array( 1 )
+
+
+# Create and initialize the instances. Each instance starts with a different slope *k*.
+
+n_instances = 100
+
+sim_start = 0.
+sim_stop = 10.
+
+fmus = []
+k_values = []
+
+for i in range( n_instances ):
+    k = 1. + i % 3
+    fmipp.double_array_setitem( init_vals, 0, k )
+
+    fmu = fmipp.IncrementalFMU( uri_to_extracted_fmu, model_name, logging_on, event_search_precision, integrator_type )
+    fmu.defineRealOutputs( output_names, 2 )
+    fmu.defineRealInputs( input_names, 1 )
+
+    status = fmu.init( 'zigzag{}'.format( i ), init_vars, init_vals, 1, sim_start, horizon, prediction_step_size, integrator_step_size )
+    assert status == 1 # check status
+
+    fmus.append( fmu )
+    k_values.append( k )
+
+
+# ## Defining the scheduler
+# 
+# Class **Scheduler** keeps all instances in a heap, sorted by their next scheduled synchronization time. Entries of the heap are never removed when an instance is rescheduled by an input event. Instead, every instance has a version number, and outdated entries are simply skipped when they reach the top of the heap.
+# 
+#  * Method *schedule* calls *sync* for an instance and adds the returned synchronization time to the heap.
+#  * Method *advance* synchronizes the instance at the top of the heap, if it is due before the given time.
+#  * Method *input_event* writes the new value of input *k* to the array of input values, then synchronizes a single instance up to the time of the event and sets its new inputs.
+#  * Method *run* processes a list of input events (sorted by time) and all scheduled synchronizations up to the stop time. At the end, all instances are synchronized up to the stop time.
+
+import heapq
+
+class Scheduler:
+
+    def __init__( self, fmus, start_time, real_input_vals, callback = None ):
+        self.fmus_ = fmus
+        self.real_input_vals_ = real_input_vals
+        self.callback_ = callback
+        self.time_ = [ start_time ] * len( fmus ) # current time of each instance
+        self.version_ = [ 0 ] * len( fmus ) # used for skipping outdated heap entries
+        self.heap_ = []
+        self.n_syncs_ = 0
+        self.n_input_events_ = 0
+        for i in range( len( fmus ) ):
+            self.schedule( i, start_time )
+
+    def schedule( self, i, t, inputs = None ):
+        if inputs is None:
+            next = self.fmus_[i].sync( self.time_[i], t )
+        else:
+            next = self.fmus_[i].sync( self.time_[i], t, inputs )
+        self.time_[i] = t
+        self.n_syncs_ += 1
+        self.version_[i] += 1
+        heapq.heappush( self.heap_, ( next, i, self.version_[i] ) )
+        if self.callback_ is not None:
+            self.callback_( i, t, self.fmus_[i] )
+
+    def next_time( self ):
+        while self.heap_ and self.heap_[0][2] != self.version_[self.heap_[0][1]]:
+            heapq.heappop( self.heap_ ) # skip outdated entry
+        return self.heap_[0][0] if self.heap_ else float( 'inf' )
+
+    def advance( self, t ):
+        if self.next_time() > t:
+            return False
+        next, i, version = heapq.heappop( self.heap_ )
+        self.schedule( i, next )
+        return True
+
+    def input_event( self, i, t, k ):
+        self.n_input_events_ += 1
+        fmipp.double_array_setitem( self.real_input_vals_, 0, k )
+        self.schedule( i, t, self.real_input_vals_ )
+
+    def run( self, events, stop_time ):
+        for ( t_event, i, k ) in events:
+            while self.advance( min( t_event, stop_time ) ):
+                pass
+            if t_event > stop_time:
+                break
+            self.input_event( i, t_event, k )
+        while self.advance( stop_time ):
+            pass
+        for i in range( len( self.fmus_ ) ):
+            if self.time_[i] < stop_time:
+                self.schedule( i, stop_time ) # synchronize up to the stop time
+
+
+# ## Run a simulation with random input events
+# 
+# Create a list of random input events. Every event is a tuple (time, instance, new value of *k*) and changes the value of *k* of a single, randomly chosen instance.
+
+import random
+random.seed( 123 )
+
+n_events = 500
+events = []
+
+for t_event in sorted( random.uniform( sim_start, sim_stop ) for e in range( n_events ) ):
+    i = random.randrange( n_instances )
+    k_values[i] = max( 1, k_values[i] + random.choice( [ 1, -2 ] ) )
+    events.append( ( t_event, i, k_values[i] ) )
+
+
+# Store the results of the first three instances, by retrieving their outputs whenever they are synchronized.
+
+n_plot = 3
+t_sim = [ [] for i in range( n_plot ) ]
+x_sim = [ [] for i in range( n_plot ) ]
+
+def store_results( i, t, fmu ):
+    if i < n_plot:
+        real_output_vals = fmu.getRealOutputs() # retrieve outputs
+        t_sim[i].append( t )
+        x_sim[i].append( fmipp.double_array_getitem( real_output_vals, 0 ) ) # retrieve x
+
+
+# Run the simulation and print the throughput of the scheduler. The measured time includes the initial synchronization of all instances when creating the scheduler.
+
+import timeit
+
+start = timeit.default_timer()
+scheduler = Scheduler( fmus, sim_start, real_input_vals, store_results )
+scheduler.run( events, sim_stop )
+elapsed = timeit.default_timer() - start
+
+print( 'synchronizations: {}'.format( scheduler.n_syncs_ ) )
+print( 'input events: {}'.format( scheduler.n_input_events_ ) )
+print( 'throughput: {:.0f} synchronizations per second'.format( scheduler.n_syncs_ / elapsed ) )
+
+
+# Plot the results.
+
+import matplotlib.pyplot as plotter
+
+for i in range( n_plot ):
+    plotter.plot( t_sim[i], x_sim[i], 'o--' )
+
+plotter.xlabel( 'simulation time' )
+plotter.ylabel( 'x' )
+
+plotter.show()
+
+
+# Arrays created with *new_string_array* and *new_double_array* are not freed automatically. Release them once they are no longer needed.
+
+fmipp.delete_string_array( init_vars )
+fmipp.delete_double_array( init_vals )
+fmipp.delete_string_array( output_names )
+fmipp.delete_string_array( input_names )
+fmipp.delete_double_array( real_input_vals )
+
+
+# Done.
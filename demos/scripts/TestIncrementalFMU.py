@@ -165,4 +165,13 @@ plotter.ylabel( 'der(x)' )
 plotter.show()
 
 
+# Arrays created with *new_string_array* and *new_double_array* are not freed automatically. Release them once they are no longer needed.
+
+fmipp.delete_string_array( init_vars )
+fmipp.delete_double_array( init_vals )
+fmipp.delete_string_array( output_names )
+fmipp.delete_string_array( input_names )
+fmipp.delete_double_array( real_input_vals )
+
+
 # Done.
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Running parameter sweeps with many FMU instances in parallel
+# 
+# FMUs are in general not thread-safe, so parameter sweeps with many variants of the same model are best distributed over several worker processes. The following example varies the slope *k* of model zigzag and simulates all variants with class **FMUModelExchangeV2**, using a pool of worker processes.
+# 
+# The FMU is extracted only once by the main process. Each worker process keeps running for the whole sweep and loads the FMU once when it starts. This first instance is kept alive for the worker's lifetime, so the FMU's shared library stays loaded and is not loaded again for each simulation run.
+# 
+# Please note that this example is only available as standard Python script, because the functions executed by the worker processes need to be importable from a module.
+# 
+# ## Loading the library and extracting an FMU
+# 
+# Load the FMI++ library into Python.
+
+import fmipp
+
+
+# Specify the FMU's model name.
+
+model_name = 'zigzag'
+
+
+# Specify the configuration parameters used by all simulation runs.
+
+logging_on = False              # turn logging on/off
+stop_before_event = False       # halt integration immediately before an event?
+event_search_precision = 1e-2   # set precision for event detection
+integrator_type = fmipp.bdf     # use Backward Differentiation Formula from CVODE
+
+
+# Specify the simulation run (start time, stop time and communication step size) and the output variables to be recorded.
+
+t_start = 0.0
+t_stop = 6.0
+stepsize = 0.125
+output_names = [ 'x', 'derx' ]
+
+
+# ## Defining a single simulation run
+# 
+# Function *init_worker* is called once in every worker process. It stores the URI of the extracted FMU, which is shared by all simulation runs of this worker, and loads the FMU. The loaded FMU is kept in a global variable of the worker, which keeps the FMU's shared library loaded until the worker exits.
+
+import timeit
+import numpy
+
+worker_uri = None
+worker_fmu = None
+
+def init_worker( uri_to_extracted_fmu ):
+    global worker_uri, worker_fmu
+    worker_uri = uri_to_extracted_fmu
+    worker_fmu = fmipp.FMUModelExchangeV2(
+       worker_uri, model_name,
+       logging_on, stop_before_event, event_search_precision, integrator_type
+       )
+
+
+# Function *simulate* runs one variant of the model. It sets the given parameters before initialization, integrates the model until the stop time and returns the recorded trajectory as NumPy array (one row per communication step, first column is the simulation time). The wall time of each run is measured as well.
+
+def simulate( run ):
+    run_id, parameters = run
+    start = timeit.default_timer()
+
+    fmu = fmipp.FMUModelExchangeV2(
+       worker_uri, model_name,
+       logging_on, stop_before_event, event_search_precision, integrator_type
+       )
+
+    status = fmu.instantiate( 'sweep_{}'.format( run_id ) ) # instantiate model
+    assert status == fmipp.fmiOK # check status
+
+    for name, value in parameters.items():
+        status = fmu.setRealValue( name, value ) # set parameter value
+        assert status == fmipp.fmiOK # check status
+
+    status = fmu.initialize() # initialize model
+    assert status == fmipp.fmiOK # check status
+
+    n_steps = int( round( ( t_stop - t_start ) / stepsize ) )
+    results = numpy.empty( ( n_steps + 1, len( output_names ) + 1 ) )
+
+    t = t_start
+    results[0,0] = t
+    results[0,1:] = [ fmu.getRealValue( name ) for name in output_names ]
+
+    for step in range( 1, n_steps + 1 ):
+        t = fmu.integrate( t_start + step * stepsize ) # integrate model
+        results[step,0] = t
+        results[step,1:] = [ fmu.getRealValue( name ) for name in output_names ]
+
+    wall_time = timeit.default_timer() - start
+    return run_id, results, wall_time
+
+
+# ## Running the parameter sweep
+# 
+# Guard the main part of the script, because worker processes may import this module (e.g., on Windows).
+
+if __name__ == '__main__':
+
+    # Specify the absolute path of the FMU and extract it to the current work directory.
+
+    import os
+    work_dir = os.getcwd() # get current working directory (contains 'zigzag.fmu')
+    path_to_fmu = os.path.join( work_dir, 'data', 'win', model_name + '.fmu' ) # path to FMU
+
+    uri_to_extracted_fmu = fmipp.extractFMU( path_to_fmu, work_dir )
+    print( 'URI of extracted FMU: {}'.format( uri_to_extracted_fmu ) )
+
+    # Define the table of parameter sets, one set per simulation run.
+
+    parameter_sets = [ { 'k' : k } for k in numpy.linspace( 0.5, 2.0, 16 ) ]
+
+    # Specify the number of worker processes (by default the number of CPUs).
+
+    import multiprocessing
+    n_workers = multiprocessing.cpu_count()
+
+    # Run the simulations. The results are returned as soon as a single run is finished, not necessarily in the order of the parameter sets.
+
+    pool = multiprocessing.Pool( n_workers, init_worker, ( uri_to_extracted_fmu, ) )
+
+    results = {}
+    for run_id, trajectory, wall_time in pool.imap_unordered( simulate, enumerate( parameter_sets ) ):
+        print( 'run {} (k = {:.2f}) finished after {:.3f} s'.format(
+           run_id, parameter_sets[run_id]['k'], wall_time ) )
+        results[run_id] = trajectory
+
+    pool.close()
+    pool.join()
+
+    # Plot the results.
+
+    import matplotlib.pyplot as plotter
+
+    for run_id in sorted( results ):
+        plotter.plot( results[run_id][:,0], results[run_id][:,1], '-' ) # plot simulated results for 'x'
+
+    plotter.xlabel( 'simulation time' )
+    plotter.ylabel( 'x' )
+    plotter.show()
+
+
+# Done.